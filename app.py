@@ -7,8 +7,8 @@ import pandas as pd
 from PIL import Image  # To handle image files
 import base64  # To encode PDF files for display
 import datetime # For date filtering in the demo
-import numpy as np # For generating sample data
 import os # To check if files exist
+from demo_feed import DEMO_FEED_FILE, get_demo_store, filter_demo_rows, filter_demo_totals, covers_whole_months # Live demo data store
 
 # --- 1. PAGE CONFIGURATION ---
 st.set_page_config(
@@ -106,19 +106,6 @@ Reply-To: {user_email}
         # This will catch timeouts and other errors
         st.error(f"An error occurred: {e}")
         return False
-@st.cache_data
-def get_demo_data():
-    np.random.seed(42)
-    dates = pd.date_range(start="2023-01-01", end="2024-12-31", freq='D')
-    data_size = len(dates)
-    departments = np.random.choice(['Finance', 'Operations', 'IT', 'Marketing', 'Sales'], data_size, p=[0.15, 0.3, 0.25, 0.15, 0.15])
-    expense_types = np.random.choice(['Software Licenses', 'Cloud Services (Azure)', 'Hardware', 'Travel', 'Consulting Fees'], data_size, p=[0.3, 0.25, 0.2, 0.1, 0.15])
-    # FIX: Create as float array to prevent casting error
-    amounts = np.random.randint(100, 5000, data_size).astype(float)
-    amounts[expense_types == 'Consulting Fees'] *= 2
-    amounts[departments == 'IT'] *= 1.5
-    df = pd.DataFrame({'Date': dates, 'Department': departments, 'Expense Type': expense_types, 'Amount ($)': amounts})
-    return df
 
 # --- 5. SIDEBAR NAVIGATION ---
 st.sidebar.title("Navigation")
@@ -261,27 +248,40 @@ elif page_selection == "💡 Live Dashboard Demo":
     
     **Scenario:** Analyzing a sample 'IT & Operations Expense' dataset.
     """)
-    df_demo = get_demo_data()
+    demo_store = get_demo_store()
+    demo_store.poll_feed(DEMO_FEED_FILE)
+    if demo_store.feed_error:
+        st.warning(demo_store.feed_error)
+    if demo_store.feed_dropped:
+        st.warning(f"{demo_store.feed_dropped:,} malformed row(s) in '{DEMO_FEED_FILE}' were skipped.")
+    df_totals = demo_store.aggregates()
     st.sidebar.header("Demo Filters")
-    min_date = df_demo['Date'].min().date()
-    max_date = df_demo['Date'].max().date()
+    min_date, max_date = demo_store.date_range()
     start_date, end_date = st.sidebar.date_input(
         "Select Date Range", [min_date, max_date], min_value=min_date, max_value=max_date
     )
-    all_departments = df_demo['Department'].unique()
+    all_departments = df_totals['Department'].unique()
     selected_departments = st.sidebar.multiselect("Select Departments", all_departments, default=all_departments)
-    all_expense_types = df_demo['Expense Type'].unique()
+    all_expense_types = df_totals['Expense Type'].unique()
     selected_expense_types = st.sidebar.multiselect("Select Expense Types", all_expense_types, default=all_expense_types)
-    df_filtered = df_demo[
-        (df_demo['Date'].dt.date >= start_date) & (df_demo['Date'].dt.date <= end_date) &
-        (df_demo['Department'].isin(selected_departments)) & (df_demo['Expense Type'].isin(selected_expense_types))
-    ]
-    if df_filtered.empty:
+    whole_months = covers_whole_months(start_date, end_date, min_date, max_date)
+    if whole_months:
+        df_selected = filter_demo_totals(df_totals, start_date, end_date, selected_departments, selected_expense_types)
+        total_spend = df_selected['Amount ($)'].sum()
+        num_transactions = int(df_selected['Count'].sum())
+        # Resample so months with no spend show as 0, exactly like the raw-row path
+        df_time = df_selected.groupby('Date')['Amount ($)'].sum().resample('ME').sum().reset_index()
+        df_bar = df_selected.groupby(['Department', 'Expense Type'])['Amount ($)'].sum().reset_index()
+    else:
+        df_selected = filter_demo_rows(demo_store.frame(), start_date, end_date, selected_departments, selected_expense_types)
+        total_spend = df_selected['Amount ($)'].sum()
+        num_transactions = len(df_selected)
+        df_time = df_selected.set_index('Date').resample('ME')['Amount ($)'].sum().reset_index()
+        df_bar = df_selected.groupby(['Department', 'Expense Type'])['Amount ($)'].sum().reset_index()
+    if num_transactions == 0:
         st.warning("No data matches your filter criteria. Please adjust the filters.")
     else:
-        total_spend = df_filtered['Amount ($)'].sum()
-        avg_transaction = df_filtered['Amount ($)'].mean()
-        num_transactions = len(df_filtered)
+        avg_transaction = total_spend / num_transactions
         st.subheader("Filtered KPIs")
         kpi_cols = st.columns(3)
         kpi_cols[0].metric("Total Spend", f"${total_spend:,.0f}")
@@ -291,22 +291,23 @@ elif page_selection == "💡 Live Dashboard Demo":
         chart_cols = st.columns([2, 1])
         with chart_cols[0]:
             st.subheader("Spend Over Time")
-            df_time = df_filtered.set_index('Date').resample('ME')['Amount ($)'].sum().reset_index()
             fig_time = px.line(df_time, x='Date', y='Amount ($)', title="Total Spend per Month", markers=True)
             fig_time.update_layout(hovermode="x unified")
             st.plotly_chart(fig_time, use_container_width=True)
         with chart_cols[1]:
             st.subheader("Spend by Department")
-            df_dept = df_filtered.groupby('Department')['Amount ($)'].sum().reset_index()
+            df_dept = df_bar.groupby('Department')['Amount ($)'].sum().reset_index()
             fig_pie_dept = px.pie(df_dept, names='Department', values='Amount ($)', title="Share of Spend", hole=0.3)
             fig_pie_dept.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig_pie_dept, use_container_width=True)
         st.markdown("---")
         st.subheader("Spend Breakdown by Expense Type and Department")
-        df_bar = df_filtered.groupby(['Department', 'Expense Type'])['Amount ($)'].sum().reset_index()
         fig_bar_stacked = px.bar(df_bar, x='Department', y='Amount ($)', color='Expense Type', title="Detailed Spend Breakdown", barmode='stack')
         st.plotly_chart(fig_bar_stacked, use_container_width=True)
-        with st.expander("View Filtered Raw Data"):
+        # A checkbox rather than an expander: expander bodies run on every rerun, and this scans every row
+        if st.checkbox("View Filtered Raw Data"):
+            df_filtered = df_selected if not whole_months else \
+                filter_demo_rows(demo_store.frame(), start_date, end_date, selected_departments, selected_expense_types)
             st.dataframe(df_filtered.sort_values(by="Date", ascending=False))
 
 # ==============================================================================
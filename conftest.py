@@ -0,0 +1 @@
+# Puts the repo root on sys.path so a plain `pytest` can import app modules such as demo_feed.
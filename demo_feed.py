@@ -0,0 +1,187 @@
+# --- DEMO DATA STORE & LIVE FEED INGESTION ---
+# Kept out of app.py so it can be imported without running the Streamlit page script.
+import csv # To split appended feed lines and spot malformed rows
+import datetime # For month-edge checks on the selected date range
+import io # To read the appended bytes as text
+import os # To check the feed file
+import threading # To guard the shared demo store across sessions
+import numpy as np # For generating sample data
+import pandas as pd
+
+DEMO_FEED_FILE = os.environ.get("DEMO_FEED_FILE", "demo_feed.csv") # Append-only CSV polled by the demo
+DEMO_COLUMNS = ['Date', 'Department', 'Expense Type', 'Amount ($)']
+
+
+def make_demo_data():
+    np.random.seed(42)
+    dates = pd.date_range(start="2023-01-01", end="2024-12-31", freq='D')
+    data_size = len(dates)
+    departments = np.random.choice(['Finance', 'Operations', 'IT', 'Marketing', 'Sales'], data_size, p=[0.15, 0.3, 0.25, 0.15, 0.15])
+    expense_types = np.random.choice(['Software Licenses', 'Cloud Services (Azure)', 'Hardware', 'Travel', 'Consulting Fees'], data_size, p=[0.3, 0.25, 0.2, 0.1, 0.15])
+    # FIX: Create as float array to prevent casting error
+    amounts = np.random.randint(100, 5000, data_size).astype(float)
+    amounts[expense_types == 'Consulting Fees'] *= 2
+    amounts[departments == 'IT'] *= 1.5
+    df = pd.DataFrame({'Date': dates, 'Department': departments, 'Expense Type': expense_types, 'Amount ($)': amounts})
+    return df
+
+def month_end(dates):
+    # Same month buckets as resample('ME'), so cached totals line up with the raw charts
+    return dates.dt.to_period('M').dt.end_time.dt.normalize()
+
+def filter_demo_rows(df, start_date, end_date, departments, expense_types):
+    return df[
+        (df['Date'].dt.date >= start_date) & (df['Date'].dt.date <= end_date) &
+        (df['Department'].isin(departments)) & (df['Expense Type'].isin(expense_types))
+    ]
+
+def covers_whole_months(start_date, end_date, min_date, max_date):
+    # Whole-month ranges can be answered from the cached totals; partial months need the raw rows.
+    # The data's own first and last day count as month edges, since nothing lies beyond them.
+    return (start_date == min_date or start_date.day == 1) and \
+        (end_date == max_date or (end_date + datetime.timedelta(days=1)).day == 1)
+
+def filter_demo_totals(df_totals, start_date, end_date, departments, expense_types):
+    return df_totals[
+        (df_totals['Date'] >= pd.Timestamp(start_date) + pd.offsets.MonthEnd(0)) &
+        (df_totals['Date'] <= pd.Timestamp(end_date) + pd.offsets.MonthEnd(0)) &
+        (df_totals['Department'].isin(departments)) & (df_totals['Expense Type'].isin(expense_types))
+    ]
+
+
+class DemoStore:
+    # Demo rows plus running per-month/Department/Expense Type totals, shared by every session.
+    # Appends only aggregate the new rows and add them in place; history is never recomputed.
+    def __init__(self, df):
+        self.lock = threading.Lock()
+        self.chunks = []
+        self.totals = {} # (month end, department, expense type) -> [sum, count]
+        self.min_date = None
+        self.max_date = None
+        self.version = 0
+        self.feed_offset = 0
+        self.feed_header = None
+        self.feed_dropped = 0 # Feed rows skipped as malformed since start-up
+        self.feed_error = None # Last problem reading the feed, shown on the dashboard
+        self._frame = None
+        self._frame_version = -1
+        self._append(df)
+
+    def _append(self, df):
+        # Returns (rows added, rows dropped as unparseable)
+        # Everything is worked out before any state changes, so a failing chunk leaves the store untouched
+        df = df[DEMO_COLUMNS].copy()
+        # Parse each value on its own (date-only, datetime, day/month) and fold any timezone into naive UTC
+        df['Date'] = pd.to_datetime(df['Date'], errors='coerce', format='mixed', utc=True).dt.tz_localize(None)
+        df['Amount ($)'] = pd.to_numeric(df['Amount ($)'], errors='coerce').astype(float)
+        received = len(df)
+        df = df.dropna()
+        if df.empty:
+            return 0, received
+        grouped = df.groupby([month_end(df['Date']), 'Department', 'Expense Type'])['Amount ($)'].agg(['sum', 'count'])
+        chunk_min, chunk_max = df['Date'].min(), df['Date'].max()
+        min_date = chunk_min if self.min_date is None else min(self.min_date, chunk_min)
+        max_date = chunk_max if self.max_date is None else max(self.max_date, chunk_max)
+        for key, row in grouped.iterrows():
+            entry = self.totals.setdefault(key, [0.0, 0])
+            entry[0] += row['sum']
+            entry[1] += int(row['count'])
+        self.min_date, self.max_date = min_date, max_date
+        self.chunks.append(df)
+        self.version += 1
+        return len(df), received - len(df)
+
+    def append(self, rows):
+        df = pd.DataFrame(rows)
+        missing = [col for col in DEMO_COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"Demo rows are missing columns: {missing}")
+        with self.lock:
+            return self._append(df)[0]
+
+    def poll_feed(self, path):
+        # Ingest any complete lines written to the append-only feed since the last poll
+        if not os.path.exists(path):
+            return 0
+        with self.lock:
+            size = os.path.getsize(path)
+            if size < self.feed_offset:
+                # Truncated, rotated or recreated: read the new file from the top
+                self.feed_offset = 0
+                self.feed_header = None
+                self.feed_error = f"Feed file '{path}' shrank; re-reading it from the start."
+            if size <= self.feed_offset:
+                return 0
+            with open(path, "rb") as f:
+                f.seek(self.feed_offset)
+                data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end == 0:
+                return 0 # Last line is still being written
+            try:
+                # utf-8-sig drops the byte-order mark spreadsheet exports put before the header
+                encoding = "utf-8-sig" if self.feed_offset == 0 else "utf-8"
+                rows = [row for row in csv.reader(io.StringIO(data[:end].decode(encoding))) if row]
+            except (csv.Error, UnicodeDecodeError) as e:
+                # Skip the unreadable chunk rather than wedging every session on it
+                self.feed_offset += end
+                self.feed_dropped += data[:end].count(b"\n")
+                self.feed_error = f"Skipped an unreadable block of '{path}': {e}"
+                return 0
+            header = self.feed_header
+            if header is None:
+                header = rows.pop(0) if rows else []
+                missing = [col for col in DEMO_COLUMNS if col not in header]
+                duplicated = sorted({col for col in header if header.count(col) > 1})
+                if missing or duplicated:
+                    # Leave the offset alone so a corrected file is picked up once it is replaced
+                    problem = f"is missing columns: {missing}" if missing else f"repeats columns: {duplicated}"
+                    self.feed_error = f"Feed file '{path}' header {problem}"
+                    return 0
+            # Rows with the wrong number of fields would otherwise shift columns and vanish silently
+            good_rows = [row for row in rows if len(row) == len(header)]
+            try:
+                added, dropped = self._append(pd.DataFrame(good_rows, columns=header))
+            except (ValueError, TypeError) as e:
+                # The store is unchanged and the offset stays put, so nothing is half-applied or lost
+                self.feed_error = f"Could not ingest new rows from '{path}': {e}"
+                return 0
+            self.feed_header = header
+            self.feed_offset += end
+            self.feed_error = None
+            self.feed_dropped += dropped + len(rows) - len(good_rows)
+            return added
+
+    def date_range(self):
+        with self.lock:
+            return self.min_date.date(), self.max_date.date()
+
+    def aggregates(self):
+        with self.lock:
+            records = [(*key, total, count) for key, (total, count) in self.totals.items()]
+        return pd.DataFrame(records, columns=DEMO_COLUMNS + ['Count'])
+
+    def frame(self):
+        # Raw rows are stitched together only when a view asks for them; this scans the full history
+        with self.lock:
+            if self._frame_version != self.version:
+                self._frame = pd.concat(self.chunks, ignore_index=True)
+                self._frame_version = self.version
+                self.chunks = [self._frame] # Keep one copy of the history, not the frame plus its pieces
+            return self._frame
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_demo_store():
+    # One store per server process, shared by every session and by in-process producers
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DemoStore(make_demo_data())
+        return _store
+
+def append_demo_rows(rows):
+    # In-process ingestion (e.g. from a background thread in the server): rows is a DataFrame or list of dicts with DEMO_COLUMNS
+    return get_demo_store().append(rows)
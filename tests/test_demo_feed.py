@@ -0,0 +1,162 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from demo_feed import (
+    DEMO_COLUMNS, DemoStore, covers_whole_months, filter_demo_rows, filter_demo_totals, make_demo_data, month_end,
+)
+
+HEADER = "Date,Department,Expense Type,Amount ($)\n"
+
+
+def recomputed(store):
+    df = store.frame()
+    grouped = df.groupby([month_end(df['Date']), 'Department', 'Expense Type'])['Amount ($)'].agg(['sum', 'count'])
+    return grouped.rename(columns={'sum': 'Amount ($)', 'count': 'Count'})
+
+
+def assert_totals_match(store):
+    cached = store.aggregates().set_index(DEMO_COLUMNS[:3]).sort_index()
+    expected = recomputed(store)
+    assert list(cached.index) == list(expected.index)
+    assert np.allclose(cached['Amount ($)'], expected['Amount ($)'])
+    assert (cached['Count'].values == expected['Count'].values).all()
+    df = store.frame()
+    assert store.date_range() == (df['Date'].min().date(), df['Date'].max().date())
+
+
+def test_appends_update_totals_in_place(tmp_path):
+    store = DemoStore(make_demo_data())
+    assert store.append([{'Date': '2025-01-03', 'Department': 'IT', 'Expense Type': 'Travel', 'Amount ($)': 10}]) == 1
+
+    feed = tmp_path / "feed.csv"
+    feed.write_text(HEADER + "2025-01-05,Sales,Hardware,20\n2025-02-01,IT,")
+    assert store.poll_feed(feed) == 1
+    with open(feed, "a") as f:
+        f.write("Travel,30\n")
+    assert store.poll_feed(feed) == 1
+    assert store.poll_feed(feed) == 0
+
+    assert_totals_match(store)
+    assert store.date_range()[1] == datetime.date(2025, 2, 1)
+    assert store.feed_dropped == 0
+
+
+def test_malformed_feed_rows_are_counted_not_ingested(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_text(HEADER + "2023-04-03,IT,Travel,5,extra\nnot-a-date,IT,Travel,5\n2023-04-04,IT,Travel,7\n")
+    assert store.poll_feed(feed) == 1
+    assert store.feed_dropped == 2
+    assert_totals_match(store)
+
+
+def test_bad_header_does_not_consume_the_feed(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_text("date,dept,type,amt\n2023-04-03,IT,Travel,5\n")
+    assert store.poll_feed(feed) == 0
+    assert store.feed_error and store.feed_offset == 0 and store.feed_header is None
+
+    feed.write_text(HEADER + "2023-04-03,IT,Travel,5\n")
+    assert store.poll_feed(feed) == 1
+    assert store.feed_error is None
+
+
+def test_truncated_feed_is_reread_from_the_start(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_text(HEADER + "2023-04-03,IT,Travel,5\n2023-04-04,IT,Travel,6\n")
+    assert store.poll_feed(feed) == 2
+    feed.write_text(HEADER + "2023-04-05,IT,Travel,7\n")
+    assert store.poll_feed(feed) == 1
+    assert_totals_match(store)
+
+
+def test_mixed_date_formats_are_all_ingested(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_text(HEADER + "2025-01-03,IT,Travel,5\n2025-01-04 10:30,IT,Travel,6\n05/01/2025,IT,Travel,7\n")
+    assert store.poll_feed(feed) == 3
+    assert store.feed_dropped == 0
+    assert_totals_match(store)
+
+
+def test_timezone_aware_rows_keep_totals_consistent(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_text(HEADER + "2025-01-03T00:00:00Z,IT,Travel,5\n2025-01-04,IT,Travel,6\n")
+    assert store.poll_feed(feed) == 2
+    assert store.feed_error is None
+    assert_totals_match(store)
+
+
+def test_duplicate_header_is_rejected(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_text("Date,Department,Expense Type,Amount ($),Date\n2023-04-03,IT,Travel,5,2023-04-03\n")
+    assert store.poll_feed(feed) == 0
+    assert "repeats columns" in store.feed_error
+    assert store.feed_offset == 0 and store.feed_header is None
+
+
+def test_byte_order_mark_header_is_accepted(tmp_path):
+    store = DemoStore(make_demo_data())
+    feed = tmp_path / "feed.csv"
+    feed.write_bytes(("\ufeff" + HEADER + "2023-04-03,IT,Travel,5\n").encode("utf-8"))
+    assert store.poll_feed(feed) == 1
+    assert store.feed_header == DEMO_COLUMNS
+
+
+def test_frame_collapses_chunks(tmp_path):
+    store = DemoStore(make_demo_data())
+    for day in range(1, 4):
+        store.append([{'Date': f'2025-01-0{day}', 'Department': 'IT', 'Expense Type': 'Travel', 'Amount ($)': day}])
+    df = store.frame()
+    assert len(store.chunks) == 1 and store.chunks[0] is df
+    store.append([{'Date': '2025-01-04', 'Department': 'IT', 'Expense Type': 'Travel', 'Amount ($)': 4}])
+    assert len(store.frame()) == len(df) + 1
+    assert_totals_match(store)
+
+
+def test_whole_month_totals_match_raw_rows():
+    store = DemoStore(make_demo_data())
+    store.append([{'Date': '2025-01-15', 'Department': 'IT', 'Expense Type': 'Travel', 'Amount ($)': 50}])
+    min_date, max_date = store.date_range()
+    departments, expense_types = ['IT', 'Finance'], ['Travel', 'Hardware', 'Consulting Fees']
+    ranges = [
+        (min_date, max_date),
+        (datetime.date(2023, 3, 1), datetime.date(2023, 8, 31)),
+        (datetime.date(2024, 2, 1), max_date),
+    ]
+    for start_date, end_date in ranges:
+        assert covers_whole_months(start_date, end_date, min_date, max_date)
+        cached = filter_demo_totals(store.aggregates(), start_date, end_date, departments, expense_types)
+        raw = filter_demo_rows(store.frame(), start_date, end_date, departments, expense_types)
+        assert np.isclose(cached['Amount ($)'].sum(), raw['Amount ($)'].sum())
+        assert cached['Count'].sum() == len(raw)
+
+    assert not covers_whole_months(datetime.date(2023, 3, 2), max_date, min_date, max_date)
+    assert not covers_whole_months(min_date, datetime.date(2023, 8, 30), min_date, max_date)
+
+
+def test_failed_append_leaves_store_and_offset_untouched(tmp_path, monkeypatch):
+    store = DemoStore(make_demo_data())
+    before = store.aggregates()
+    feed = tmp_path / "feed.csv"
+    feed.write_text(HEADER + "2025-01-03,IT,Travel,5\n")
+
+    def broken_month_end(dates):
+        raise ValueError("boom")
+
+    monkeypatch.setattr("demo_feed.month_end", broken_month_end)
+    assert store.poll_feed(feed) == 0
+    assert "boom" in store.feed_error
+    assert store.feed_offset == 0 and store.feed_header is None
+    assert store.aggregates().equals(before)
+
+    monkeypatch.undo()
+    assert store.poll_feed(feed) == 1
+    assert store.feed_dropped == 0
+    assert_totals_match(store)